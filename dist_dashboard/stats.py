@@ -1,30 +1,114 @@
 from functools import lru_cache
 
 import numpy as np
-import pandas as pd
-from scipy import stats
 
 
 SEED = 12345  # For reproducability
 
-distribution_functions = {
-    "Normal": stats.norm,
-    "Poisson": stats.poisson,
-    "Bernoulli": stats.bernoulli,
-    "Uniform": stats.uniform,
-    "Geometric": stats.geom,
-    "Alpha": stats.alpha,
-    "Students t": stats.t,
-    "Beta": stats.beta,
-    "Chi Squared": stats.chi2,
-    "Exponential": stats.expon,
-    "F": stats.f,
-    "Gamma": stats.gamma,
-    "Pareto": stats.pareto,
-    "Binomial": stats.binom,
-    "Negative Binomial": stats.nbinom,
+# Hashing the seed is the expensive part of setting up a generator; do it
+# once at import.
+_SEED_SEQUENCE = np.random.SeedSequence(SEED)
+
+
+def _seeded_rng() -> np.random.Generator:
+    """Get a new generator positioned at the start of the seeded stream.
+
+    Restarting the stream for every draw keeps samples reproducible: equal
+    parameters always produce equal samples. Passing the integer `SEED`
+    to scipy instead would make it build a legacy `RandomState` on every
+    call, which is an order of magnitude more expensive.
+
+    Returns:
+        numpy.random.Generator: A seeded random number generator.
+    """
+    return np.random.Generator(np.random.PCG64(_SEED_SEQUENCE))
+
+
+# Samplers drawing directly from a numpy Generator. scipy's generic rvs
+# wrappers spend an order of magnitude more time validating & dispatching
+# arguments than actually drawing at these sample sizes. Each entry takes
+# (rng, size, *parameters) with parameters in the same order the scipy
+# calls used before.
+_numpy_samplers = {
+    "Normal": lambda rng, size, loc, scale: rng.normal(loc, scale, size),
+    "Poisson": lambda rng, size, mu: rng.poisson(mu, size),
+    "Bernoulli": lambda rng, size, p: rng.binomial(1, p, size),
+    "Uniform": lambda rng, size, loc, scale: rng.uniform(
+        loc, loc + scale, size
+    ),
+    "Geometric": lambda rng, size, p: rng.geometric(p, size),
+    "Students t": lambda rng, size, df: rng.standard_t(df, size),
+    "Beta": lambda rng, size, a, b: rng.beta(a, b, size),
+    "Chi Squared": lambda rng, size, df: rng.chisquare(df, size),
+    "Exponential": lambda rng, size, loc: loc + rng.exponential(1, size),
+    "F": lambda rng, size, dfn, dfd: rng.f(dfn, dfd, size),
+    "Gamma": lambda rng, size, a: rng.gamma(a, 1, size),
+    # scipy's Pareto has support [1, inf); numpy's is the shifted Lomax
+    # form with support [0, inf).
+    "Pareto": lambda rng, size, b: rng.pareto(b, size) + 1,
+    "Binomial": lambda rng, size, n, p: rng.binomial(n, p, size),
+    "Negative Binomial": lambda rng, size, n, p: rng.negative_binomial(
+        n, p, size
+    ),
 }
 
+# The discrete samplers return int64; narrower dtypes cut the memory the
+# statistics reductions have to move. Bernoulli values fit a byte, the
+# rest comfortably in 32 bits at the dashboard's parameter ranges.
+_discrete_dtypes = {
+    "Bernoulli": np.uint8,
+    "Binomial": np.int32,
+    "Geometric": np.int32,
+    "Negative Binomial": np.int32,
+    "Poisson": np.int32,
+}
+
+# Distributions numpy has no generator method for; sampled through scipy.
+_scipy_dist_names = {
+    "Alpha": "alpha",
+}
+
+
+@lru_cache(maxsize=None)
+def _get_scipy_dist(distribution: str):
+    """Look up the scipy equivalent of the given distribution.
+
+    scipy.stats drags in dozens of submodules, so it is imported lazily —
+    worker start-up no longer pays for it, and processes that never sample
+    an "Alpha" distribution skip it altogether.
+
+    Args:
+        distribution (str): Name of probability distribution.
+
+    Returns:
+        scipy.stats.rv_continuous: The matching scipy distribution object.
+    """
+    from scipy import stats
+
+    return getattr(stats, _scipy_dist_names[distribution])
+
+
+@lru_cache(maxsize=32)
+def _frozen_scipy_dist(distribution: str, parameters: tuple):
+    """Freeze the scipy distribution with the given parameters.
+
+    scipy revalidates shape parameters on every generic rvs call; a frozen
+    object keyed by (name, parameters) pays that once.
+
+    Args:
+        distribution (str): Name of probability distribution.
+        parameters (tuple): Validated parameter values for `distribution`.
+
+    Returns:
+        scipy.stats.rv_frozen: The parameterized distribution object.
+    """
+    return _get_scipy_dist(distribution)(*parameters)
+
+
+# Distribution categories needing extra parameter checks.
+_PROBABILITY_DISTS = frozenset({"Bernoulli", "Geometric"})
+_TRIAL_COUNT_DISTS = frozenset({"Binomial", "Negative Binomial"})
+
 
 def validate_parameters(distribution: str, parameters: tuple) -> tuple:
     """Check parameters to ensure that they are appropriate for the given
@@ -32,18 +116,21 @@ def validate_parameters(distribution: str, parameters: tuple) -> tuple:
 
     Args:
         distribution (str): Name of probability distribution.
-        parameters (tuple): Parameter values for `distribution`.
+        parameters (tuple): Parameter values for `distribution`. The caller
+            drops unused slots (e.g. the hidden ``parameter2``) beforehand.
 
     Returns:
         tuple: Validated parameter list.
     """
-    # Remove `parameter2`==None in distributions with single parameter.
-    param_tuple = tuple(param for param in parameters if param is not None)
+    # Rounding to the slider's 0.01 resolution collapses float-repr jitter
+    # (e.g. 1.2300000000000002) into identical cache keys downstream.
+    param_tuple = tuple(round(param, 2) for param in parameters)
 
-    if distribution in {"Bernoulli", "Geometric"}:
-        # Probability must be in the range [0, 1]
-        return param_tuple if 0 <= param_tuple[0] <= 1 else (0.5,)
-    elif distribution in {"Binomial", "Negative Binomial"}:
+    if distribution in _PROBABILITY_DISTS:
+        # Probability must be in the range [0, 1]. Return exactly the one
+        # parameter these distributions take, whatever arrived.
+        return (param_tuple[0],) if 0 <= param_tuple[0] <= 1 else (0.5,)
+    elif distribution in _TRIAL_COUNT_DISTS:
         # Number of trials must be an integer
         n = round(param_tuple[0])
         # Probability must be in the range [0, 1]
@@ -53,29 +140,97 @@ def validate_parameters(distribution: str, parameters: tuple) -> tuple:
         return param_tuple
 
 
-def get_summary_statistics(data: pd.Series) -> dict:
+def _fast_mode(sorted_values: np.ndarray):
+    """Get the most frequent value in the given sorted sample.
+
+    Args:
+        sorted_values (numpy.ndarray): Sample values, in ascending order.
+
+    Returns:
+        The modal value, with the sample's scalar type.
+    """
+    # Small non-negative integer samples (the discrete distributions) can
+    # use a direct bincount instead of the grouping pass in np.unique.
+    if (
+        np.issubdtype(sorted_values.dtype, np.integer)
+        and sorted_values[0] >= 0
+        and sorted_values[-1] < 100_000
+    ):
+        return np.bincount(sorted_values).argmax()
+    unique_values, counts = np.unique(sorted_values, return_counts=True)
+    return unique_values[counts.argmax()]
+
+
+def get_summary_statistics(data: np.ndarray) -> dict:
     """Compute descriptive statistics for the generated sample.
 
     Args:
-        data (pandas.Series): Sample values.
+        data (numpy.ndarray): Sample values.
 
     Returns:
         dict: Summary statistics.
     """
-    q1, q2, q3 = np.quantile(data, [0.25, 0.5, 0.75])
+    sorted_values = np.sort(data)
+    n = sorted_values.size
+
+    # One sort yields the extremes, the quartiles (linearly interpolated
+    # from the order statistics, identical to np.quantile) and the mode,
+    # instead of separate quantile, min, max and scipy.stats.mode calls
+    # each walking the data again.
+    positions = (n - 1) * np.array([0.25, 0.5, 0.75])
+    lower = positions.astype(int)
+    fraction = positions - lower
+    q1, q2, q3 = (
+        sorted_values[lower] * (1 - fraction)
+        + sorted_values[np.minimum(lower + 1, n - 1)] * fraction
+    )
+
     return {
-        "Count": len(data),
-        "Mean": data.mean(),
-        "Standard Deviation": data.std(),
-        "Minimum": data.min(),
+        "Count": n,
+        # Reductions read the sorted copy too, so every statistic works on
+        # the same cache-warm buffer.
+        "Mean": sorted_values.mean(),
+        "Standard Deviation": sorted_values.std(ddof=1),
+        "Minimum": sorted_values[0],
         "Q1": q1,
         "Median": q2,
         "Q3": q3,
-        "Maximum": data.max(),
-        "Mode": stats.mode(data, keepdims=False).mode,
+        "Maximum": sorted_values[-1],
+        "Mode": _fast_mode(sorted_values),
     }
 
 
+# Upper bound of the dashboard's sample-size slider.
+_MAX_SAMPLE_SIZE = 300
+
+
+@lru_cache(maxsize=10)
+def _draw_full_sample(distribution: str, parameters: tuple) -> np.ndarray:
+    """Draw a sample of the maximum selectable size.
+
+    Moving the sample-size slider then only reslices this buffer instead
+    of re-running the generator, so smaller samples are always prefixes
+    of larger ones for the same distribution & parameters.
+
+    Args:
+        distribution (str): Name of probability distribution.
+        parameters (tuple): Validated parameter values for `distribution`.
+
+    Returns:
+        numpy.ndarray: `_MAX_SAMPLE_SIZE` sampled values.
+    """
+    sampler = _numpy_samplers.get(distribution)
+    if sampler is not None:
+        values = sampler(_seeded_rng(), _MAX_SAMPLE_SIZE, *parameters)
+        # Continuous draws keep ~7 significant digits in float32 — plenty
+        # for plotting and 5-decimal statistics at half the memory.
+        dtype = _discrete_dtypes.get(distribution, np.float32)
+        return values.astype(dtype, copy=False)
+    return _frozen_scipy_dist(distribution, parameters).rvs(
+        size=_MAX_SAMPLE_SIZE, random_state=_seeded_rng()
+    ).astype(np.float32, copy=False)
+
+
 @lru_cache(maxsize=10)
 def process_random_sample(
     distribution: str, size: int, parameters: tuple
@@ -93,14 +248,9 @@ def process_random_sample(
         statistics.
     """
     parameters = validate_parameters(distribution, parameters)
-    sample_data = pd.Series(
-        distribution_functions[distribution].rvs(
-            *parameters, size=size, random_state=SEED
-        ),
-        name=f"{distribution}-sample",
-    )
+    values = _draw_full_sample(distribution, parameters)[:size]
     return {
-        "data": sample_data,
+        "data": values,
         "parameters": parameters,
-        "summary_statistics": get_summary_statistics(sample_data),
+        "summary_statistics": get_summary_statistics(values),
     }